@@ -109,6 +109,9 @@ PATH_APP_LOGFILE = BASE_DIR / 'app.log'
 # Symbols excel file
 PATH_SYMBOLS_EXCHANGE_FILE = BASE_DIR / 'symbols_exchange.xlsx'
 
+# Local cache for TradingView technical analysis (one entry per symbol, reused within the hour)
+PATH_TECHNICAL_ANALYSIS_CACHE = BASE_DIR / '.ta_cache'
+
 # Symbols and exchange
 df =pd.read_excel(PATH_SYMBOLS_EXCHANGE_FILE)
 SYMBOLS_EXCHANGE = dict(zip(df['symbol'], df['exchange']))
@@ -118,6 +121,7 @@ SYMBOLS = list(SYMBOLS_EXCHANGE.keys())
 # monte_carlo_simulator
 RANDOM_SEED=42
 IV_CORRECTION_MODE= 'auto'
+SIMULATION_SAMPLER = 'sobol'  # 'sobol' (quasi-Monte-Carlo) or 'pseudo' (pseudo-random normals)
 RISK_FREE_RATE = 0.03
 NUM_SIMULATIONS = 100000
 TRANSACTION_COST_PER_CONTRACT = 2.0 # in USD
@@ -90,8 +90,10 @@ if load_btn and symbol_input:
                 if pd.isna(current_price):
                     current_price = all_df["stock_close"].iloc[0]
 
-                puts_df = all_df[all_df["contract_type"] == "put"].copy()
-                calls_df = all_df[all_df["contract_type"] == "call"].copy()
+                # Parse expirations once here; the display section below only reads these frames
+                all_df["expiration_date"] = pd.to_datetime(all_df["expiration_date"])
+                puts_df = all_df[all_df["contract_type"] == "put"]
+                calls_df = all_df[all_df["contract_type"] == "call"]
 
                 st.session_state["pit_puts_df"] = puts_df if not puts_df.empty else None
                 st.session_state["pit_calls_df"] = calls_df if not calls_df.empty else None
@@ -108,7 +110,7 @@ elif load_btn:
 # DISPLAY
 # =====================================================================
 if st.session_state["pit_puts_df"] is not None:
-    puts_df = st.session_state["pit_puts_df"].copy()
+    puts_df = st.session_state["pit_puts_df"]
     calls_df = st.session_state["pit_calls_df"]
     current_price = st.session_state["pit_current_price"]
     symbol = st.session_state["pit_symbol"]
@@ -122,16 +124,12 @@ if st.session_state["pit_puts_df"] is not None:
     )
 
     # ── Month dropdowns + Strike filter ─────────────────────────────
-    puts_df["expiration_date"] = pd.to_datetime(puts_df["expiration_date"])
     put_month_opts = get_month_options_with_dte(puts_df)
 
     # Prepare call months (only if calls exist)
     call_month_opts: list[tuple[str, str]] = []
     if calls_df is not None and not calls_df.empty:
-        calls_df = calls_df.copy()
-        calls_df["expiration_date"] = pd.to_datetime(calls_df["expiration_date"])
-        if not calls_df.empty:
-            call_month_opts = get_month_options_with_dte(calls_df)
+        call_month_opts = get_month_options_with_dte(calls_df)
 
     c_pm, c_cm, c_flt, c_oi = st.columns([2, 2, 2, 1.5])
     with c_pm:
@@ -191,16 +189,14 @@ if st.session_state["pit_puts_df"] is not None:
                 break
 
     # ── Filter puts by selected month ───────────────────────────────
+    # The session frames are never modified in place; each filter step selects a new frame
     if sel_put_ym:
-        puts_df["ym"] = puts_df["expiration_date"].apply(lambda x: x.strftime("%Y-%m"))
-        filtered_puts = puts_df[puts_df["ym"] == sel_put_ym].copy()
+        filtered_puts = puts_df[puts_df["expiration_date"].dt.strftime("%Y-%m") == sel_put_ym]
     else:
-        filtered_puts = puts_df.copy()
+        filtered_puts = puts_df
 
     # Only puts with strike >= cost basis (meaningful protection)
-    filtered_puts = filtered_puts[
-        filtered_puts["strike_price"] >= cost_basis_input
-    ].copy()
+    filtered_puts = filtered_puts[filtered_puts["strike_price"] >= cost_basis_input]
 
     # Apply moneyness filter
     filtered_puts = filter_strikes_by_moneyness(
@@ -209,8 +205,8 @@ if st.session_state["pit_puts_df"] is not None:
 
     # Apply OI filter
     if min_oi_input > 0 and "open_interest" in filtered_puts.columns:
-        filtered_puts["open_interest"] = filtered_puts["open_interest"].fillna(0)
-        filtered_puts = filtered_puts[filtered_puts["open_interest"] >= min_oi_input].copy()
+        # Missing OI counts as 0, so those rows never pass a positive minimum
+        filtered_puts = filtered_puts[filtered_puts["open_interest"] >= min_oi_input]
 
     if filtered_puts.empty:
         st.info("Keine Put-Optionen für diese Filter-Kombination gefunden.")
@@ -218,11 +214,7 @@ if st.session_state["pit_puts_df"] is not None:
         # ── Calculate metrics ───────────────────────────────────────
         if collar_enabled and sel_call_ym and calls_df is not None:
             # Filter calls by selected call month
-            calls_df_c = calls_df.copy()
-            calls_df_c["ym"] = calls_df_c["expiration_date"].apply(
-                lambda x: x.strftime("%Y-%m")
-            )
-            month_calls = calls_df_c[calls_df_c["ym"] == sel_call_ym].copy()
+            month_calls = calls_df[calls_df["expiration_date"].dt.strftime("%Y-%m") == sel_call_ym]
 
             result_df = calculate_collar_metrics(
                 filtered_puts, month_calls, cost_basis_input, current_price,
@@ -248,17 +248,22 @@ def _parse_dataframe(df: pd.DataFrame) -> pd.DataFrame:
 
 def _scrape(symbols, delay_seconds):
     results = []
+    next_request_at = time.monotonic()
 
     for i, symbol in enumerate(symbols, 1):
         print(f"[{i}/{len(symbols)}] {symbol}")
 
+        # Pace requests to one per delay_seconds. The time spent waiting on the
+        # previous response already counts towards the delay, so only the
+        # remainder is slept instead of a flat pause after every symbol.
+        wait_seconds = next_request_at - time.monotonic()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        next_request_at = time.monotonic() + delay_seconds
+
         symbol_data = _scrape_symbol(symbol)
         results.append(symbol_data)
 
-        # Pause between requests to avoid rate limiting.
-        if i < len(symbols):
-            time.sleep(delay_seconds)
-
     df = pd.DataFrame(results)
 
     return df
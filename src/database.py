@@ -2,6 +2,8 @@ import time
 import datetime
 import os
 import re
+import csv
+from io import StringIO
 import pandas as pd
 import logging
 from typing import Literal
@@ -129,12 +131,42 @@ def log_data_change(connection, operation_type, table_name, affected_rows=None,
         logger.error(f"Error logging data change: \n{e}")
         raise e
 
+# NULL marker for COPY ... CSV (the default, an unquoted empty field, would swallow empty strings)
+_COPY_NULL = r'\N'
+
+def _copy_insert(table, connection, keys, data_iter):
+    """
+    pandas.DataFrame.to_sql insertion method that streams the rows as CSV through PostgreSQL COPY.
+
+    Much faster than multi-row INSERT statements for large frames. Missing values arrive as None
+    and are written as the explicit NULL marker \\N, so empty strings are still loaded as ''
+    (a literal string value '\\N' would load as NULL, like in PostgreSQL's text format).
+    """
+    buffer = StringIO()
+    csv.writer(buffer).writerows(
+        [_COPY_NULL if value is None else value for value in row] for row in data_iter
+    )
+    buffer.seek(0)
+
+    columns = ", ".join(f'"{key}"' for key in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    with connection.connection.cursor() as cur:
+        cur.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')", buffer)
+        return cur.rowcount
+
 def insert_into_table(
         connection,
         table_name: str,
         dataframe: pd.DataFrame,
-        if_exists: Literal["fail", "replace", "append"] = "append"
+        if_exists: Literal["fail", "replace", "append"] = "append",
+        use_copy: bool = False
     ) -> int:
+    """
+    Inserts a DataFrame into a table, keeping only the columns that exist in the table.
+
+    Set use_copy=True for large frames of plain scalar columns (numbers, strings, timestamps):
+    the rows are then loaded with PostgreSQL COPY instead of multi-row INSERT statements.
+    """
 
     try:
 
@@ -161,8 +193,8 @@ def insert_into_table(
                             connection, 
                             if_exists=if_exists, 
                             index=False,
-                            method='multi',
-                            chunksize=500
+                            method=_copy_insert if use_copy else 'multi',
+                            chunksize=None if use_copy else 500
                         )
         rows_saved = len(dataframe)
         logger.info(f"[PostgreSQL] Successfully saved {rows_saved} rows to {table_name} in {round(time.time() - start_pg, 2)}s.")
@@ -1,4 +1,5 @@
 import logging
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -17,22 +18,26 @@ def cleanup_old_logs(retention_days: int = RETENTION_DAYS) -> None:
     deleted_files = 0
     deleted_dirs = 0
 
-    for component_dir in LOGS_BASE.iterdir():
-        if not component_dir.is_dir():
-            continue
-        for date_dir in sorted(component_dir.iterdir()):
-            if not date_dir.is_dir():
-                continue
-            if date_dir.name >= cutoff:
-                continue
-            for log_file in date_dir.iterdir():
-                try:
-                    log_file.unlink()
-                    deleted_files += 1
-                except Exception as e:
-                    logger.warning(f"Could not delete {log_file}: {e}")
+    # os.scandir: DirEntry.is_dir() uses the type from the directory listing instead of one stat() per entry
+    with os.scandir(LOGS_BASE) as component_dirs:
+        component_paths = [entry.path for entry in component_dirs if entry.is_dir()]
+
+    for component_path in component_paths:
+        with os.scandir(component_path) as date_dirs:
+            expired_dirs = sorted(
+                (entry for entry in date_dirs if entry.is_dir() and entry.name < cutoff),
+                key=lambda entry: entry.name,
+            )
+        for date_dir in expired_dirs:
+            with os.scandir(date_dir.path) as log_files:
+                for log_file in log_files:
+                    try:
+                        os.unlink(log_file.path)
+                        deleted_files += 1
+                    except Exception as e:
+                        logger.warning(f"Could not delete {log_file.path}: {e}")
             try:
-                date_dir.rmdir()
+                os.rmdir(date_dir.path)
                 deleted_dirs += 1
             except OSError:
                 pass  # not empty, skip
@@ -45,24 +45,24 @@ def _midpoint_price(df: pd.DataFrame) -> pd.Series:
     return df["option_price"]
 
 
-def _put_label(row: pd.Series) -> str:
-    """Build a readable put description like 'TSLA 2024 02-AUG 240.00 PUT (28)'."""
-    exp = row["expiration_date"]
+def _option_labels(df: pd.DataFrame, option_type: str) -> pd.Series:
+    """Build readable option descriptions like 'TSLA 2024 02-AUG 240.00 PUT (28)' for all rows at once."""
+    exp = pd.to_datetime(df["expiration_date"]).dt
     return (
-        f"{row['symbol']} {exp.year} "
-        f"{exp.strftime('%d-%b').upper()} "
-        f"{row['strike_price']:.2f} PUT ({int(row['days_to_expiration'])})"
+        df["symbol"].astype(str) + " " + exp.year.astype(str) + " "
+        + exp.strftime("%d-%b").str.upper() + " "
+        + df["strike_price"].map("{:.2f}".format) + f" {option_type} ("
+        + df["days_to_expiration"].astype(int).astype(str) + ")"
     )
 
 
-def _call_label(row: pd.Series) -> str:
-    """Build a readable call description like 'TSLA 2024 12-JUL 240.00 CALL (7)'."""
-    exp = row["expiration_date"]
-    return (
-        f"{row['symbol']} {exp.year} "
-        f"{exp.strftime('%d-%b').upper()} "
-        f"{row['strike_price']:.2f} CALL ({int(row['days_to_expiration'])})"
-    )
+def _safe_div(numerator, denominator, where, scale: float = 1.0) -> np.ndarray:
+    """``numerator / denominator * scale`` where *where* holds, 0.0 elsewhere (no division warnings)."""
+    out = np.zeros(np.shape(denominator))
+    np.divide(np.asarray(numerator, dtype=float), np.asarray(denominator, dtype=float), out=out, where=where)
+    if scale != 1.0:
+        out *= scale
+    return out
 
 
 # ── core functions ──────────────────────────────────────────────────
@@ -92,37 +92,36 @@ def calculate_put_only_metrics(
     if puts_df.empty:
         return puts_df
 
-    df = puts_df.copy()
-    df["expiration_date"] = pd.to_datetime(df["expiration_date"])
-
-    # Best available price
-    midprice = _midpoint_price(df)
-
-    df["put_label"] = df.apply(_put_label, axis=1)
-    df["put_midpoint_price"] = midprice
+    # Input columns as plain arrays (no index alignment per operation)
+    midprice = _midpoint_price(puts_df).to_numpy(dtype=float)  # best available price
+    strike = puts_df["strike_price"].to_numpy(dtype=float)
+    dte = puts_df["days_to_expiration"].to_numpy(dtype=float)
 
     # Intrinsic & time value
-    df["intrinsic_value"] = (df["strike_price"] - current_price).clip(lower=0)
-    df["put_time_value"] = (midprice - df["intrinsic_value"]).clip(lower=0)  # ← min. 0!
+    intrinsic_value = np.maximum(strike - current_price, 0.0)
+    time_value = np.maximum(midprice - intrinsic_value, 0.0)  # ← min. 0!
 
     # Time value per month (30-day basis)
-    df["put_time_value_per_mo"] = df.apply(
-        lambda r: r["put_time_value"] / (r["days_to_expiration"] / 30)
-        if r["days_to_expiration"] > 0 else 0.0,
-        axis=1,
-    )
+    time_value_per_mo = _safe_div(time_value, dte / 30, where=dte > 0)
 
     # New cost basis & locked-in profit
-    df["new_cost_basis"] = cost_basis + midprice
-    df["locked_in_profit"] = df["strike_price"] - df["new_cost_basis"]
-    df["locked_in_profit_pct"] = df.apply(
-        lambda r: (r["locked_in_profit"] / r["new_cost_basis"] * 100)
-        if r["new_cost_basis"] != 0 else 0.0,
-        axis=1,
+    new_cost_basis = cost_basis + midprice
+    locked_in_profit = strike - new_cost_basis
+    locked_in_profit_pct = _safe_div(locked_in_profit, new_cost_basis, where=new_cost_basis != 0, scale=100)
+
+    # Build the result frame in one step instead of growing a copy column by column
+    return puts_df.assign(
+        expiration_date=pd.to_datetime(puts_df["expiration_date"]),
+        put_label=_option_labels(puts_df, "PUT"),
+        put_midpoint_price=midprice,
+        intrinsic_value=intrinsic_value,
+        put_time_value=time_value,
+        put_time_value_per_mo=time_value_per_mo,
+        new_cost_basis=new_cost_basis,
+        locked_in_profit=locked_in_profit,
+        locked_in_profit_pct=locked_in_profit_pct,
     )
 
-    return df
-
 
 def calculate_collar_metrics(
     puts_df: pd.DataFrame,
@@ -158,61 +157,59 @@ def calculate_collar_metrics(
 
     if calls_df is None or calls_df.empty:
         # No calls -> add empty call columns for consistent schema
-        for col in ("call_label", "call_midpoint_price", "pct_assigned", "pct_assigned_with_put"):
-            put_metrics[col] = None
-        return put_metrics
+        return put_metrics.assign(
+            **dict.fromkeys(("call_label", "call_midpoint_price", "pct_assigned", "pct_assigned_with_put"))
+        )
 
     # Prepare calls with midpoint
-    calls = calls_df.copy()
-    calls["expiration_date"] = pd.to_datetime(calls["expiration_date"])
-    calls["_mid"] = _midpoint_price(calls)
-
-    # Build list of result rows
-    rows: list[dict] = []
-
-    for _, put_row in put_metrics.iterrows():
-        put_strike = float(put_row["strike_price"])
-        put_mid = float(put_row["put_midpoint_price"])
-
-        # All calls with strike >= put strike (same-strike + wide collar)
-        valid_calls = calls[calls["strike_price"] >= put_strike]
-
-        if valid_calls.empty:
-            # No valid call -> put-only row with empty call columns
-            row_dict = put_row.to_dict()
-            row_dict["call_label"] = None
-            row_dict["call_midpoint_price"] = None
-            row_dict["pct_assigned"] = None
-            row_dict["pct_assigned_with_put"] = None
-            rows.append(row_dict)
-            continue
-
-        for _, call_row in valid_calls.iterrows():
-            cp = float(call_row["_mid"])
-            cs = float(call_row["strike_price"])
-
-            ncb = cost_basis + put_mid - cp
-            lip = put_strike - ncb
-            lip_pct = (lip / ncb * 100) if ncb != 0 else 0.0
-
-            # % Assigned (gain if shares called away at call strike)
-            pa = ((cs - ncb) / ncb * 100) if ncb != 0 else 0.0
-
-            # % Assigned with Put (includes residual put value)
-            put_residual = max(0.0, put_strike - cs)
-            pawp = ((cs - ncb + put_residual) / ncb * 100) if ncb != 0 else 0.0
-
-            row_dict = put_row.to_dict()
-            row_dict["call_label"] = _call_label(call_row)
-            row_dict["call_midpoint_price"] = cp
-            row_dict["new_cost_basis"] = ncb
-            row_dict["locked_in_profit"] = lip
-            row_dict["locked_in_profit_pct"] = lip_pct
-            row_dict["pct_assigned"] = pa
-            row_dict["pct_assigned_with_put"] = pawp
-            rows.append(row_dict)
-
-    return pd.DataFrame(rows)
+    calls = calls_df
+    call_mid = _midpoint_price(calls).to_numpy(dtype=float)
+    call_strike = calls["strike_price"].to_numpy(dtype=float)
+    call_labels = _option_labels(calls, "CALL").to_numpy()
+
+    # Pair every put with all calls whose strike >= put strike (same-strike + wide collar),
+    # in put order and call order within each put. Puts without a valid call keep a single
+    # put-only row (call index -1) with empty call columns.
+    put_strike_all = put_metrics["strike_price"].to_numpy(dtype=float)
+    put_idx, call_idx = np.nonzero(call_strike[np.newaxis, :] >= put_strike_all[:, np.newaxis])
+    unmatched = np.setdiff1d(np.arange(len(put_metrics)), put_idx)
+    put_idx = np.concatenate([put_idx, unmatched])
+    call_idx = np.concatenate([call_idx, np.full(unmatched.size, -1)])
+    order = np.argsort(put_idx, kind="stable")
+    put_idx, call_idx = put_idx[order], call_idx[order]
+
+    result = put_metrics.take(put_idx)
+    result.index = pd.RangeIndex(len(result))
+    has_call = call_idx >= 0
+    put_strike = put_strike_all[put_idx]
+    put_mid = result["put_midpoint_price"].to_numpy(dtype=float)
+    cp = np.where(has_call, call_mid[call_idx], np.nan)
+    cs = np.where(has_call, call_strike[call_idx], np.nan)
+
+    ncb = np.where(has_call, cost_basis + put_mid - cp, result["new_cost_basis"])
+    lip = np.where(has_call, put_strike - ncb, result["locked_in_profit"])
+    collar_ncb = has_call & (ncb != 0)
+    lip_pct = np.where(has_call, _safe_div(lip, ncb, where=collar_ncb, scale=100), result["locked_in_profit_pct"])
+
+    # % Assigned (gain if shares called away at call strike)
+    pa = _safe_div(cs - ncb, ncb, where=collar_ncb, scale=100)
+
+    # % Assigned with Put (includes residual put value)
+    put_residual = np.maximum(0.0, put_strike - cs)
+    pawp = _safe_div(cs - ncb + put_residual, ncb, where=collar_ncb, scale=100)
+    pa[~has_call] = np.nan
+    pawp[~has_call] = np.nan
+
+    # `result` is a fresh frame from take(), so write the columns into it directly;
+    # assign() would copy every put column a second time
+    result["call_label"] = np.where(has_call, call_labels[call_idx], None)
+    result["call_midpoint_price"] = cp
+    result["new_cost_basis"] = ncb
+    result["locked_in_profit"] = lip
+    result["locked_in_profit_pct"] = lip_pct
+    result["pct_assigned"] = pa
+    result["pct_assigned_with_put"] = pawp
+    return result
 
 
 def get_month_options(df: pd.DataFrame) -> list[tuple[str, str]]:
@@ -1,4 +1,6 @@
 import logging
+import numpy as np
+from scipy.stats import rankdata
 from src.logger_config import setup_logging
 from config import *
 from src.decorator_log_function import log_function
@@ -17,23 +19,23 @@ def calculate_multifactor_swingtrading_strategy(
         drop_weak_value_factors: bool = False,
 ) -> pd.DataFrame:
 
-    # handel missing values
+    # handel missing values (dropna and the filters below return new frames, the input is never modified)
     if drop_missing_values:
-        df = df.copy().dropna()
+        df = df.dropna()
         logger.debug(f"df after missing values filter... shape {df.shape}")
-    else:
-        df = df.copy()
 
     # handel weak value factors
     if drop_weak_value_factors:
-        df = df[
-            (df['price_to_book'] >= 0.3) & (df['price_to_book'] <= 2.0) &
-            (df['price_to_earnings'] >= 5) & (df['price_to_earnings'] <= 30) &
-            (df['price_to_sales'] <= 2.0) &
-            (df['ebitda_to_enterprise_value'] >= 0.05) &
-            (df['price_to_cashflow'] > 0) &
-            (df['1_year_price_appreciation'] > - 0.3)
-            ]
+        # single fused expression, evaluated by numexpr when it is installed
+        mask = df.eval(
+            "(price_to_book >= 0.3) & (price_to_book <= 2.0) &"
+            "(price_to_earnings >= 5) & (price_to_earnings <= 30) &"
+            "(price_to_sales <= 2.0) &"
+            "(ebitda_to_enterprise_value >= 0.05) &"
+            "(price_to_cashflow > 0) &"
+            "(`1_year_price_appreciation` > -0.3)"
+        )
+        df = df.loc[mask.to_numpy()]
         logger.debug(f"df after drop weak value factor filter... shape {df.shape}")
 
     # Value factors where low is better
@@ -48,31 +50,47 @@ def calculate_multifactor_swingtrading_strategy(
     # Value factor where high is better
     value_factor_high = 'shareholder_yield'
 
-    # 1. Calculate percentiles for low-is-better factors (invert: 100 - percentile)
-    for col in value_factors_low:
-        df[f'{col}_percentile'] = (100 - df[col].rank(pct=True) * 100).round(2)
+    # 1. Calculate percentiles for all factors in one pass (same as Series.rank(pct=True):
+    # average rank for ties, NaN stays NaN and does not count towards the total)
+    factor_cols = value_factors_low + [value_factor_high]
+    percentile_cols = [f'{col}_percentile' for col in factor_cols]
+    values = df[factor_cols].to_numpy(dtype=np.float64)
+    ranks = rankdata(values, method='average', axis=0, nan_policy='omit')
+    with np.errstate(invalid='ignore'):
+        percentiles = ranks / np.count_nonzero(~np.isnan(values), axis=0) * 100
 
-    # Calculate percentiles for high-is-better factors (use normally)
-    df[f'{value_factor_high}_percentile'] = (df[value_factor_high].rank(pct=True) * 100).round(2)
+    # Invert low-is-better factors (100 - percentile), high-is-better is used normally
+    num_low = len(value_factors_low)
+    percentiles[:, :num_low] = 100 - percentiles[:, :num_low]
+    percentiles = np.round(percentiles, 2)
 
     # 2. Calculate value score as SUM of percentiles (all already correctly oriented)
-    percentile_cols = [f'{col}_percentile' for col in value_factors_low]
-    percentile_cols.append(f'{value_factor_high}_percentile')
-    df['value_score'] = df[percentile_cols].sum(axis=1).round(2)
-
-    # 3. Filter to top X percent by value score
-    threshold = df['value_score'].quantile(1 - (top_percentile_value_score / 100))
-    df_filtered = df[df['value_score'] >= threshold].copy()
-
-    # 4. Sort by value score descending and return top N stocks
-    df_result = df_filtered.nlargest(top_n, 'value_score')
+    value_scores = np.round(np.nansum(percentiles, axis=1), 2)
+
+    # 3. Filter to top X percent by value score (no-op at 100 percent)
+    positions = np.arange(value_scores.size)
+    if top_percentile_value_score < 100 and value_scores.size:
+        threshold = np.quantile(value_scores, 1 - (top_percentile_value_score / 100))
+        positions = positions[value_scores >= threshold]
+
+    # 4. Select top N stocks by value score descending via partial selection: every row that ties
+    # with the N-th largest score is a candidate, ties are broken by position like nlargest(keep='first')
+    top_k = min(top_n, positions.size)
+    if top_k > 0:
+        candidate_scores = value_scores[positions]
+        kth_score = np.partition(candidate_scores, candidate_scores.size - top_k)[candidate_scores.size - top_k]
+        positions = positions[candidate_scores >= kth_score]
+        positions = positions[np.lexsort((positions, -value_scores[positions]))][:top_k]
+    else:
+        positions = positions[:0]
 
-    # 5. Reset index and reorder columns
-    df_result = df_result.reset_index(drop=True)
+    # 5. Take only the selected rows, then attach their percentiles and score
+    df_result = df.iloc[positions].reset_index(drop=True)
+    df_result[percentile_cols] = percentiles[positions]
 
-    # Move symbol to first column, then value_score, then rest
-    cols = ['symbol', 'value_score'] + [col for col in df_result.columns if col not in ['symbol', 'value_score']]
-    df_result = df_result[cols]
+    # Move symbol to first column, then value_score, then rest (insert in place instead of copying all columns)
+    df_result.insert(0, 'value_score', value_scores[positions])
+    df_result.insert(0, 'symbol', df_result.pop('symbol'))
 
     return df_result
 
@@ -83,7 +83,7 @@ def calculate_expected_value(
     current_price: float,
     dte: float,
     volatility: float,
-    options: List[Dict[str, Any]],
+    options: List[Union[Dict[str, Any], OptionLeg]],
     risk_free_rate: float = RISK_FREE_RATE,
     dividend_yield: float = DIVIDEND_YIELD,
     num_simulations: int = NUM_SIMULATIONS,
@@ -125,17 +125,12 @@ def calculate_strategy_metrics(
 ) -> StrategyMetrics:
     """Calculates all metrics for a given strategy with arbitrary legs."""
     
-    # 1. Expected Value & IV Correction
-    options_sim = [
-        {'strike': leg.strike, 'premium': leg.premium, 'is_call': leg.is_call, 'is_long': leg.is_long}
-        for leg in legs
-    ]
-    
+    # 1. Expected Value & IV Correction (the simulator reads the OptionLeg attributes directly)
     ev_details = calculate_expected_value(
         current_price=current_price,
         dte=dte,
         volatility=volatility,
-        options=options_sim,
+        options=legs,
         risk_free_rate=risk_free_rate,
         dividend_yield=dividend_yield,
         num_simulations=num_simulations,
@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 import urllib.parse
 import os
+from functools import lru_cache
 
 try:
     import streamlit as st
@@ -22,6 +24,22 @@ SECTOR_PROMPT_MAP = {
     "Utilities": "prompt_utilities.txt",
 }
 
+# Columns read by the Claude prompt builders per page (all other columns are dropped before building)
+_CLAUDE_PROMPT_COMMON_COLUMNS = ['symbol', 'Company', 'company_sector']
+CLAUDE_PROMPT_COLUMNS = {
+    'spreads': _CLAUDE_PROMPT_COMMON_COLUMNS + [
+        'option_type', 'sell_strike', 'sell_last_option_price', 'sell_delta',
+        'buy_strike', 'buy_last_option_price', 'expiration_date',
+    ],
+    'iron_condors': _CLAUDE_PROMPT_COMMON_COLUMNS + [
+        'sell_strike_put', 'sell_delta_put', 'buy_strike_put', 'expiration_date_put',
+        'sell_strike_call', 'sell_delta_call', 'buy_strike_call', 'expiration_date_call',
+    ],
+    'dividend_scanner': _CLAUDE_PROMPT_COMMON_COLUMNS + [
+        'name', 'sector', 'trailing_pe', 'dividend_yield', 'payout_ratio', 'rsi', 'iv_rank_val',
+    ],
+}
+
 _PROMPTS_DIR = os.path.join(os.path.dirname(__file__), "prompts")
 
 
@@ -30,45 +48,69 @@ def _get_sector_prompt(sector, symbol):
     Returns None if sector is unknown or file not found."""
     if not sector or sector not in SECTOR_PROMPT_MAP:
         return None
-    filepath = os.path.join(_PROMPTS_DIR, SECTOR_PROMPT_MAP[sector])
+    prompt = _read_sector_prompt(SECTOR_PROMPT_MAP[sector])
+    if prompt is None:
+        return None
+    return prompt.replace("[ZZZ]", symbol)
+
+
+@lru_cache(maxsize=None)
+def _read_sector_prompt(filename):
+    """Reads a sector prompt file once per process instead of once per table row."""
+    filepath = os.path.join(_PROMPTS_DIR, filename)
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            prompt = f.read()
-        return prompt.replace("[ZZZ]", symbol)
+            return f.read()
     except (FileNotFoundError, IOError):
         return None
 
 
 def _add_tradingview_link(df:pd.DataFrame, symbol_column='symbol') -> pd.DataFrame:
-    df['TradingView'] = df[symbol_column].apply(
-        lambda x: f'https://www.tradingview.com/symbols/{x}/'
-    )
+    df['TradingView'] = 'https://www.tradingview.com/symbols/' + df[symbol_column].astype(str) + '/'
     return df
 
 def _add_tradingview_superchart_link(df:pd.DataFrame, symbol_column='symbol') -> pd.DataFrame:
-    df['Chart'] = df[symbol_column].apply(
-        lambda x: f'https://www.tradingview.com/chart/?symbol={x}'
-    )
+    df['Chart'] = 'https://www.tradingview.com/chart/?symbol=' + df[symbol_column].astype(str)
     return df
 
 
 def _add_claude_analysis_link(df: pd.DataFrame, page=None) -> pd.DataFrame:
     """Adds Claude AI analysis link with pre-filled prompt"""
-    if page is None:
-        df['Claude'] = df.apply(_create_claude_prompt_default, axis=1)
-    elif page == 'spreads':
-        df['Claude'] = df.apply(_create_claude_prompt_page_spreads, axis=1)
+    prompt_columns = CLAUDE_PROMPT_COLUMNS.get(page, _CLAUDE_PROMPT_COMMON_COLUMNS)
+    prompt_df = df[[col for col in prompt_columns if col in df.columns]]
+    try:
+        content_hash = pd.util.hash_pandas_object(prompt_df, index=False).to_numpy().tobytes()
+    except TypeError:
+        # unhashable cells (lists, dicts): build the links without caching
+        df['Claude'] = _build_claude_links.__wrapped__(None, tuple(prompt_df.columns), page, prompt_df)
+        return df
+    df['Claude'] = _build_claude_links(content_hash, tuple(prompt_df.columns), page, prompt_df)
+    return df
+
+
+def _cache_claude_links(func):
+    """Caches across Streamlit reruns, which rebuild the same prompts on every widget interaction."""
+    cached = st.cache_data(show_spinner=False, max_entries=32)(func) if st is not None else func
+    cached.__wrapped__ = func
+    return cached
+
+
+@_cache_claude_links
+def _build_claude_links(content_hash, columns, page, _df: pd.DataFrame) -> list:
+    # content_hash, columns and page form the cache key, the leading underscore excludes _df from hashing
+    if page == 'spreads':
+        create_prompt = _create_claude_prompt_page_spreads
     elif page == 'iron_condors':
-        df['Claude'] = df.apply(_create_claude_prompt_page_iron_condors, axis=1)
+        create_prompt = _create_claude_prompt_page_iron_condors
     elif page == 'dividend_scanner':
-        df['Claude'] = df.apply(_create_claude_prompt_dividend_scanner, axis=1)
+        create_prompt = _create_claude_prompt_dividend_scanner
     else:
-        df['Claude'] = df.apply(_create_claude_prompt_default, axis=1)
-    return df
+        create_prompt = _create_claude_prompt_default
+    # plain dicts support row[...] and row.get(...) like a Series, without building a Series per row
+    return [create_prompt(row) for row in _df.to_dict('records')]
 
-def _get_claude_prompt_header(symbol, company=None):
-    company_info = f" ({company})" if company else ""
-    return f"""
+
+_CLAUDE_PROMPT_HEADER = """
 Erstelle eine kompakte Aktienanalyse für {symbol}{company_info}:
 Unternehmen: Geschäftsmodell und Branche (1-2 Sätzen):
 
@@ -87,134 +129,170 @@ maximalem Expertenwissen und gebe eine klare Empfehlung Strategie umsetzen oder
 Begründe deine Entscheidung nachvollziehbar mit KPIs.
 """
 
-def _get_claude_prompt_footer():
-    return """
+_CLAUDE_PROMPT_FOOTER = """
 Format: Prägnant, faktenbasiert, keine Füllwörter, max. eine Seite.
 Rolle: Aktien und Finanzexperte.
 """
 
-def _create_claude_prompt_page_spreads(row):
-    symbol = row['symbol']
-    sector = row.get('company_sector')
-
-    strategy_details = f"""
-Beurteile zusätzlich folgende Options-Strategie für {symbol}:
-Verkaufe einen {row['option_type']} Strike {row['sell_strike']} für eine Prämie von {row['sell_last_option_price']} bei einem Delta
-von {row['sell_delta']}. Kaufe einen {row['option_type']} mit Strike {row['buy_strike']}
-für eine Prämie von {row['buy_last_option_price']}. Expirationdate ist jeweils {row['expiration_date']}
-Gehe besonders auf die Gewinnwahrscheinlichkeit ein und gib eine klare Empfehlung: Strategie umsetzen oder nicht.
+_SPREADS_LEGS = """
+Verkaufe einen {option_type} Strike {sell_strike} für eine Prämie von {sell_last_option_price} bei einem Delta
+von {sell_delta}. Kaufe einen {option_type} mit Strike {buy_strike}
+für eine Prämie von {buy_last_option_price}. Expirationdate ist jeweils {expiration_date}
 """
 
-    # Try sector-specific prompt + strategy details
-    sector_prompt = _get_sector_prompt(sector, symbol)
-    if sector_prompt:
-        prompt = sector_prompt.strip() + "\n" + strategy_details
-        encoded_prompt = urllib.parse.quote(prompt.strip())
-        return f'https://claude.ai/new?q={encoded_prompt}'
+_IRON_CONDOR_LEGS = """
+Put-Seite: Verkauf Strike {sell_strike_put} (Delta {sell_delta_put}), Kauf Strike {buy_strike_put}. Expiration: {expiration_date_put}
+Call-Seite: Verkauf Strike {sell_strike_call} (Delta {sell_delta_call}), Kauf Strike {buy_strike_call}. Expiration: {expiration_date_call}
+"""
 
-    # Fallback: generic prompt
-    prompt = _get_claude_prompt_header(symbol, row.get('Company'))
-    prompt += f"""
-Verkaufe einen {row['option_type']} Strike {row['sell_strike']} für eine Prämie von {row['sell_last_option_price']} bei einem Delta
-von {row['sell_delta']}. Kaufe einen {row['option_type']} mit Strike {row['buy_strike']}
-für eine Prämie von {row['buy_last_option_price']}. Expirationdate ist jeweils {row['expiration_date']}
+_STRATEGY_RECOMMENDATION = "Gehe besonders auf die Gewinnwahrscheinlichkeit ein und gib eine klare Empfehlung: Strategie umsetzen oder nicht."
+
+# Prompt text following a sector prompt, and the generic fallback prompt (both already stripped like the final prompt)
+_SPREADS_SECTOR_DETAILS = (
+    "\n\nBeurteile zusätzlich folgende Options-Strategie für {symbol}:" + _SPREADS_LEGS + _STRATEGY_RECOMMENDATION
+)
+_SPREADS_FALLBACK = (_CLAUDE_PROMPT_HEADER + _SPREADS_LEGS + _CLAUDE_PROMPT_FOOTER).strip()
+_IRON_CONDOR_SECTOR_DETAILS = (
+    "\n\nBeurteile zusätzlich folgende Iron Condor Strategie für {symbol}:" + _IRON_CONDOR_LEGS + _STRATEGY_RECOMMENDATION
+)
+_IRON_CONDOR_FALLBACK = (
+    _CLAUDE_PROMPT_HEADER + "\nIron Condor Strategie:" + _IRON_CONDOR_LEGS + _CLAUDE_PROMPT_FOOTER
+).strip()
+
+_DIVIDEND_SCANNER_CONTEXT = """
+Aktuelle Kennzahlen aus meinem Screening:
+- KGV (P/E): {trailing_pe}
+- Dividendenrendite: {dividend_yield}%
+- Payout Ratio: {payout_ratio}%
+- RSI (14): {rsi}
+- IV-Rank: {iv_rank}%
+
+Analysiere die Aktie besonders im Hinblick auf die Nachhaltigkeit der Dividende und ob das aktuelle technische Niveau (RSI, Vola) einen attraktiven Einstieg (Long oder Short Put) rechtfertigt.
 """
-    prompt += _get_claude_prompt_footer()
+_DIVIDEND_SCANNER_SECTOR_DETAILS = ("\n" + _DIVIDEND_SCANNER_CONTEXT + _CLAUDE_PROMPT_FOOTER).rstrip()
+_DIVIDEND_SCANNER_FALLBACK = (_CLAUDE_PROMPT_HEADER + _DIVIDEND_SCANNER_CONTEXT + _CLAUDE_PROMPT_FOOTER).strip()
 
-    encoded_prompt = urllib.parse.quote(prompt.strip())
-    return f'https://claude.ai/new?q={encoded_prompt}'
+_DEFAULT_PROMPT = """
+Erstelle eine kompakte Aktienanalyse für {symbol}{company_info}:
+Unternehmen: Geschäftsmodell und Branche in 1-2 Sätzen
+Aktuelle News: Wichtigste Entwicklungen der letzten 4 Wochen
+Anstehende Events: Earnings, Produktlaunches oder relevante Termine
+Einschätzung:
 
-def _create_claude_prompt_page_iron_condors(row):
-    symbol = row['symbol']
-    sector = row.get('company_sector')
+Kauf/Halten/Verkaufen mit Begründung
+Aktuelles Kursziel (Analystenkonsens)
+Eigenes Kursziel durch Fundamentaldaten, News, Technische Analyse State of the Art
+Wichtigste Chance und größtes Risiko
 
-    strategy_details = f"""
-Beurteile zusätzlich folgende Iron Condor Strategie für {symbol}:
-Put-Seite: Verkauf Strike {row['sell_strike_put']} (Delta {row['sell_delta_put']}), Kauf Strike {row['buy_strike_put']}. Expiration: {row['expiration_date_put']}
-Call-Seite: Verkauf Strike {row['sell_strike_call']} (Delta {row['sell_delta_call']}), Kauf Strike {row['buy_strike_call']}. Expiration: {row['expiration_date_call']}
-Gehe besonders auf die Gewinnwahrscheinlichkeit ein und gib eine klare Empfehlung: Strategie umsetzen oder nicht.
-"""
+Format: Prägnant, faktenbasiert, keine Füllwörter, max. eine Seite.
+    """
+
+
+@lru_cache(maxsize=None)
+def _quoted_template(template):
+    """URL-encoded template; the braces stay literal so the fields can still be filled in."""
+    return urllib.parse.quote(template, safe='/{}')
+
+
+def _quote_template(template, **fields):
+    """
+    Same as urllib.parse.quote(template.format(**fields)), but the static text is encoded only once per
+    template and only the (short) field values are encoded per call. Percent-encoding works character
+    by character, so encoding the pieces separately gives the same string.
+    """
+    return _quoted_template(template).format(
+        **{name: urllib.parse.quote(format(value)) for name, value in fields.items()}
+    )
+
+
+@lru_cache(maxsize=None)
+def _quoted_sector_prompt(sector):
+    prompt = _read_sector_prompt(SECTOR_PROMPT_MAP[sector])
+    return urllib.parse.quote(prompt.strip()) if prompt is not None else None
+
+
+def _get_quoted_sector_prompt(sector, symbol):
+    """URL-encoded variant of _get_sector_prompt(sector, symbol).strip()."""
+    if not sector or sector not in SECTOR_PROMPT_MAP:
+        return None
+    quoted_prompt = _quoted_sector_prompt(sector)
+    if quoted_prompt is None:
+        return None
+    return quoted_prompt.replace(urllib.parse.quote("[ZZZ]"), urllib.parse.quote(symbol))
+
+
+def _create_claude_prompt_strategy(row, sector_details, fallback, leg_columns):
+    symbol = row['symbol']
+    legs = {col: row[col] for col in leg_columns}
 
     # Try sector-specific prompt + strategy details
-    sector_prompt = _get_sector_prompt(sector, symbol)
-    if sector_prompt:
-        prompt = sector_prompt.strip() + "\n" + strategy_details
-        encoded_prompt = urllib.parse.quote(prompt.strip())
+    quoted_sector_prompt = _get_quoted_sector_prompt(row.get('company_sector'), symbol)
+    if quoted_sector_prompt:
+        encoded_prompt = quoted_sector_prompt + _quote_template(sector_details, symbol=symbol, **legs)
         return f'https://claude.ai/new?q={encoded_prompt}'
 
     # Fallback: generic prompt
-    prompt = _get_claude_prompt_header(symbol, row.get('Company'))
-    prompt += f"""
-Iron Condor Strategie:
-Put-Seite: Verkauf Strike {row['sell_strike_put']} (Delta {row['sell_delta_put']}), Kauf Strike {row['buy_strike_put']}. Expiration: {row['expiration_date_put']}
-Call-Seite: Verkauf Strike {row['sell_strike_call']} (Delta {row['sell_delta_call']}), Kauf Strike {row['buy_strike_call']}. Expiration: {row['expiration_date_call']}
-"""
-    prompt += _get_claude_prompt_footer()
-
-    encoded_prompt = urllib.parse.quote(prompt.strip())
+    company = row.get('Company')
+    company_info = f" ({company})" if company else ""
+    encoded_prompt = _quote_template(fallback, symbol=symbol, company_info=company_info, **legs)
     return f'https://claude.ai/new?q={encoded_prompt}'
 
+def _create_claude_prompt_page_spreads(row):
+    return _create_claude_prompt_strategy(
+        row, _SPREADS_SECTOR_DETAILS, _SPREADS_FALLBACK,
+        ('option_type', 'sell_strike', 'sell_last_option_price', 'sell_delta',
+         'buy_strike', 'buy_last_option_price', 'expiration_date'),
+    )
+
+def _create_claude_prompt_page_iron_condors(row):
+    return _create_claude_prompt_strategy(
+        row, _IRON_CONDOR_SECTOR_DETAILS, _IRON_CONDOR_FALLBACK,
+        ('sell_strike_put', 'sell_delta_put', 'buy_strike_put', 'expiration_date_put',
+         'sell_strike_call', 'sell_delta_call', 'buy_strike_call', 'expiration_date_call'),
+    )
+
 def _create_claude_prompt_dividend_scanner(row):
     symbol = row['symbol']
     company = row.get('name') or row.get('Company')
     sector = row.get('sector') or row.get('company_sector')
 
-    # Try sector-specific prompt
-    sector_prompt = _get_sector_prompt(sector, symbol)
-    
     # Context for dividend scanner
-    scanner_context = f"""
-Aktuelle Kennzahlen aus meinem Screening:
-- KGV (P/E): {row.get('trailing_pe', 'N/A')}
-- Dividendenrendite: {row.get('dividend_yield', 0)*100:.2f}%
-- Payout Ratio: {row.get('payout_ratio', 0)*100:.1f}%
-- RSI (14): {row.get('rsi', 'N/A')}
-- IV-Rank: {row.get('iv_rank_val', 0)*100:.1f}%
-
-Analysiere die Aktie besonders im Hinblick auf die Nachhaltigkeit der Dividende und ob das aktuelle technische Niveau (RSI, Vola) einen attraktiven Einstieg (Long oder Short Put) rechtfertigt.
-"""
+    kpis = {
+        'trailing_pe': row.get('trailing_pe', 'N/A'),
+        'dividend_yield': f"{row.get('dividend_yield', 0)*100:.2f}",
+        'payout_ratio': f"{row.get('payout_ratio', 0)*100:.1f}",
+        'rsi': row.get('rsi', 'N/A'),
+        'iv_rank': f"{row.get('iv_rank_val', 0)*100:.1f}",
+    }
 
-    if sector_prompt:
-        prompt = sector_prompt.strip() + "\n" + scanner_context
+    # Try sector-specific prompt
+    quoted_sector_prompt = _get_quoted_sector_prompt(sector, symbol)
+    if quoted_sector_prompt:
+        encoded_prompt = quoted_sector_prompt + _quote_template(_DIVIDEND_SCANNER_SECTOR_DETAILS, **kpis)
     else:
-        prompt = _get_claude_prompt_header(symbol, company) + scanner_context
-    
-    prompt += _get_claude_prompt_footer()
-    
-    encoded_prompt = urllib.parse.quote(prompt.strip())
+        company_info = f" ({company})" if company else ""
+        encoded_prompt = _quote_template(_DIVIDEND_SCANNER_FALLBACK, symbol=symbol, company_info=company_info, **kpis)
     return f'https://claude.ai/new?q={encoded_prompt}'
 
 def _create_claude_prompt_default(row):
     symbol = row['symbol']
-    sector = row.get('company_sector')
 
     # Try sector-specific prompt
-    sector_prompt = _get_sector_prompt(sector, symbol)
-    if sector_prompt:
-        encoded_prompt = urllib.parse.quote(sector_prompt.strip())
-        return f'https://claude.ai/new?q={encoded_prompt}'
+    quoted_sector_prompt = _get_quoted_sector_prompt(row.get('company_sector'), symbol)
+    if quoted_sector_prompt:
+        return f'https://claude.ai/new?q={quoted_sector_prompt}'
 
     # Fallback: generic prompt
     company = row.get('Company')
     company_info = f" ({company})" if company else ""
+    encoded_prompt = _quote_template(_DEFAULT_PROMPT, symbol=symbol, company_info=company_info)
+    return f'https://claude.ai/new?q={encoded_prompt}'
 
-    prompt = f"""
-Erstelle eine kompakte Aktienanalyse für {symbol}{company_info}:
-Unternehmen: Geschäftsmodell und Branche in 1-2 Sätzen
-Aktuelle News: Wichtigste Entwicklungen der letzten 4 Wochen
-Anstehende Events: Earnings, Produktlaunches oder relevante Termine
-Einschätzung:
-
-Kauf/Halten/Verkaufen mit Begründung
-Aktuelles Kursziel (Analystenkonsens)
-Eigenes Kursziel durch Fundamentaldaten, News, Technische Analyse State of the Art
-Wichtigste Chance und größtes Risiko
-
-Format: Prägnant, faktenbasiert, keine Füllwörter, max. eine Seite.
-    """
 
-    encoded_prompt = urllib.parse.quote(prompt)
-    return f'https://claude.ai/new?q={encoded_prompt}'
+def _color_negative_red(df: pd.DataFrame) -> pd.DataFrame:
+    """CSS for the whole numeric block at once (one vectorized comparison instead of one call per cell)."""
+    is_negative = df.lt(0).to_numpy(dtype=bool, na_value=False)
+    return pd.DataFrame(np.where(is_negative, 'color: #ff4444', ''), index=df.index, columns=df.columns)
 
 
 def page_display_dataframe(
@@ -239,9 +317,13 @@ def page_display_dataframe(
         selection_mode: Streamlit selection mode ("single-row", "multi-row")
     """
     df_to_display = df.copy()
-    df_to_display = _add_tradingview_link(df_to_display, symbol_column)
-    df_to_display = _add_tradingview_superchart_link(df_to_display, symbol_column)
-    df_to_display = _add_claude_analysis_link(df_to_display, page)
+    if df_to_display.empty:
+        # common after tight filters: keep the link columns for a consistent header, nothing to build per row
+        df_to_display = df_to_display.assign(TradingView='', Chart='', Claude='')
+    else:
+        df_to_display = _add_tradingview_link(df_to_display, symbol_column)
+        df_to_display = _add_tradingview_superchart_link(df_to_display, symbol_column)
+        df_to_display = _add_claude_analysis_link(df_to_display, page)
 
     if page == "spreads":
         # drop unnecessary columns which where needed for the AI prompt generation
@@ -310,19 +392,26 @@ def page_display_dataframe(
         )
     }
 
+    # One dtype scan: numeric columns are styled, the float subset of them is formatted
+    numeric_cols = df_to_display.select_dtypes(include='number').columns
+    float_cols = numeric_cols[[dtype.kind == 'f' for dtype in df_to_display.dtypes[numeric_cols]]]
+
     # Auto-format all float columns to 2 decimal places
-    for col in df_to_display.columns:
-        if df_to_display[col].dtype in ['float64', 'float32']:
-            default_config[col] = st.column_config.NumberColumn(
-                col,
-                format="%.2f"
-            )
-
-    # Apply styling: color negative numbers red
-    styled_df = df_to_display.style.map(
-        lambda val: 'color: #ff4444' if isinstance(val, (int, float)) and val < 0 else '',
-        subset=df_to_display.select_dtypes(include=['number']).columns
-    )
+    for col in float_cols:
+        default_config[col] = st.column_config.NumberColumn(
+            col,
+            format="%.2f"
+        )
+
+    # Apply styling: color negative numbers red (an empty table has nothing to style)
+    if df_to_display.empty:
+        styled_df = df_to_display
+    else:
+        styled_df = df_to_display.style.apply(
+            _color_negative_red,
+            axis=None,
+            subset=numeric_cols
+        )
 
     # Merge with provided column_config if exists.
     # column_config has a higher priority than the default.
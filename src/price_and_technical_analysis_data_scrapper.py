@@ -1,8 +1,11 @@
 import logging
 import sys
 import os
+import time
 import pandas as pd
-from config import SYMBOLS_EXCHANGE, TABLE_TECHNICAL_INDICATORS
+from cachelib import FileSystemCache
+from concurrent.futures import ThreadPoolExecutor
+from config import PATH_TECHNICAL_ANALYSIS_CACHE, SYMBOLS_EXCHANGE, TABLE_TECHNICAL_INDICATORS
 from src.database import get_postgres_engine, insert_into_table, truncate_table
 from tradingview_ta import Interval, get_multiple_analysis
 from typing import Dict
@@ -12,45 +15,74 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 logger = logging.getLogger(__name__)
 
+# Parallel scan requests to TradingView (each covers one batch of up to 100 symbols)
+MAX_CONCURRENT_BATCHES = 4
+
+# 1h interval -> an analysis fetched within the current hour is reused instead of requested again
+ANALYSIS_CACHE_BUCKET_SECONDS = 3600
+
+
+def _get_analysis_cache():
+    # One file per EXCHANGE:SYMBOL that is overwritten on refresh, so the cache never outgrows the universe
+    return FileSystemCache(str(PATH_TECHNICAL_ANALYSIS_CACHE), threshold=0, default_timeout=ANALYSIS_CACHE_BUCKET_SECONDS)
+
+
 def scrape_and_save_price_and_technical_indicators(stocks_with_exchange):
     
-    underlying_symbols = [f"{stock['exchange']}:{stock['symbol']}" for index, stock in stocks_with_exchange.iterrows()]
+    underlying_symbols = (
+        stocks_with_exchange["exchange"].astype(str) + ":" + stocks_with_exchange["symbol"].astype(str)
+    ).tolist()
 
     results = []
-    analysis = {}  # als Dictionary initialisieren
 
-    # Unterteile underlying_symbols in 500er-Pakete (API Limit)
+    # Reuse analyses already fetched in the current hour bucket; only the rest goes to TradingView
+    cache = _get_analysis_cache()
+    bucket = int(time.time() // ANALYSIS_CACHE_BUCKET_SECONDS)
+    cached = cache.get_dict(*underlying_symbols) if underlying_symbols else {}
+    analysis = {  # symbol -> (indicators, summary)
+        symbol_: entry[1:] for symbol_, entry in cached.items() if entry is not None and entry[0] == bucket
+    }
+    symbols_to_fetch = [symbol_ for symbol_ in underlying_symbols if symbol_ not in analysis]
+    logger.info(f"Technical analysis cache: {len(analysis)} fresh, {len(symbols_to_fetch)} to fetch")
+
+    # Unterteile die restlichen Symbole in 100er-Pakete (ein Scan-Request pro Paket)
     batch_size = 100
-    symbol_batches = [underlying_symbols[i:i + batch_size] for i in range(0, len(underlying_symbols), batch_size)]
-    batch = 1
-    for symbol_batch in symbol_batches:
+    symbol_batches = [symbols_to_fetch[i:i + batch_size] for i in range(0, len(symbols_to_fetch), batch_size)]
+
+    def fetch_batch(batch, symbol_batch):
         logger.info(f"Fetching technical analysis for batch ({batch}/{len(symbol_batches)}) of {len(symbol_batch)} symbols...")
         try:
-            analysis_symbol_batch = get_multiple_analysis(screener="america", interval=Interval.INTERVAL_1_HOUR, symbols=symbol_batch)
+            return get_multiple_analysis(screener="america", interval=Interval.INTERVAL_1_HOUR, symbols=symbol_batch)
         except Exception as e:
             logger.error(f"Error fetching technical analysis for batch {symbol_batch}: {e}")
             raise e
-        analysis.update(analysis_symbol_batch)  # analysis_symbol_batch muss ein dict sein
-        batch += 1
+
+    # Network-bound step: fetch a few batches concurrently (map keeps batch order and re-raises the first error)
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_BATCHES, max(1, len(symbol_batches)))) as pool:
+        for analysis_symbol_batch in pool.map(fetch_batch, range(1, len(symbol_batches) + 1), symbol_batches):
+            for symbol_, data in analysis_symbol_batch.items():  # analysis_symbol_batch muss ein dict sein
+                fetched[symbol_] = None if data is None else (data.indicators, data.summary)
+
+    # Symbols without analysis (None) are not cached so the next run asks again
+    cache.set_many({symbol_: (bucket, *entry) for symbol_, entry in fetched.items() if entry is not None})
+    analysis.update(fetched)
 
     # Use the exchange from SYMBOLS_EXCHANGE mapping
-    for symbol_ in analysis:
-        exchange = symbol_.split(":")[0]
-        symbol = symbol_.split(":")[1]
+    for symbol_, entry in analysis.items():
+        exchange, symbol = symbol_.split(":", 1)
         if not exchange:
             print(f"WARNING: No exchange found for symbol {symbol}. Skipping.")
             continue
         try:
-            # get indicator values
-            data = analysis[symbol_]
-
-            # extract values
-            indicators = data.indicators
+            # extract indicator values
+            indicators, summary = entry
+            indicators = dict(indicators)
             indicators["symbol"] = symbol
-            indicators["recommendation"] = data.summary["RECOMMENDATION"]
-            indicators["recommendation_buy_amount"] = data.summary["BUY"]
-            indicators["recommendation_neutral_amount"] = data.summary["NEUTRAL"]
-            indicators["recommendation_sell_amount"] = data.summary["SELL"]
+            indicators["recommendation"] = summary["RECOMMENDATION"]
+            indicators["recommendation_buy_amount"] = summary["BUY"]
+            indicators["recommendation_neutral_amount"] = summary["NEUTRAL"]
+            indicators["recommendation_sell_amount"] = summary["SELL"]
             results.append(indicators)
 
         except Exception as e:
@@ -66,5 +98,6 @@ def scrape_and_save_price_and_technical_indicators(stocks_with_exchange):
             connection,
             table_name=TABLE_TECHNICAL_INDICATORS,
             dataframe=df,
-            if_exists="append"
+            if_exists="append",
+            use_copy=True
         )
@@ -0,0 +1,39 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.database import _copy_insert
+
+
+class FakeCursor:
+    rowcount = 2
+
+    def __init__(self):
+        self.sql = None
+        self.data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, sql, buffer):
+        self.sql = sql
+        self.data = buffer.read()
+
+
+def test_copy_insert_streams_rows_as_csv():
+    cursor = FakeCursor()
+    connection = SimpleNamespace(connection=SimpleNamespace(cursor=lambda: cursor))
+    table = SimpleNamespace(schema=None, name="TechnicalIndicators")
+    rows = [(1.5, "x,y", datetime(2026, 1, 1)), (None, None, None), (0.0, "", None)]
+
+    affected = _copy_insert(table, connection, ["close", "symbol", "last_updated"], iter(rows))
+
+    assert affected == 2
+    assert cursor.sql == (
+        'COPY "TechnicalIndicators" ("close", "symbol", "last_updated") '
+        "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    # None -> \N (NULL), while the empty string stays an empty field that COPY loads as ''
+    assert cursor.data == '1.5,"x,y",2026-01-01 00:00:00\r\n\\N,\\N,\\N\r\n0.0,,\\N\r\n'
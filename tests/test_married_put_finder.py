@@ -0,0 +1,64 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.married_put_finder import calculate_collar_metrics, calculate_put_only_metrics
+
+
+@pytest.fixture
+def sample_puts():
+    return pd.DataFrame({
+        'symbol': ['PG', 'PG'],
+        'strike_price': [165.0, 180.0],
+        'expiration_date': ['2026-12-18', '2026-12-18'],
+        'days_to_expiration': [61, 0],
+        'option_price': [4.0, 11.0],
+        'premium_option_price': [np.nan, 10.5],
+    })
+
+
+@pytest.fixture
+def sample_calls():
+    return pd.DataFrame({
+        'symbol': ['PG', 'PG'],
+        'strike_price': [175.0, 170.0],
+        'expiration_date': ['2026-11-20', '2026-11-20'],
+        'days_to_expiration': [33, 33],
+        'option_price': [1.0, 2.0],
+        'premium_option_price': [1.2, 2.4],
+    })
+
+
+def test_put_only_metrics(sample_puts):
+    df = calculate_put_only_metrics(sample_puts, cost_basis=160.0, current_price=170.0)
+
+    assert df['put_label'].tolist() == ['PG 2026 18-DEC 165.00 PUT (61)', 'PG 2026 18-DEC 180.00 PUT (0)']
+    assert df['put_midpoint_price'].tolist() == [4.0, 10.5]
+    assert df['put_time_value'].tolist() == pytest.approx([4.0, 0.5])
+    assert df['put_time_value_per_mo'].tolist() == pytest.approx([4.0 / (61 / 30), 0.0])
+    assert df['locked_in_profit_pct'].tolist() == pytest.approx([1 / 164 * 100, 9.5 / 170.5 * 100])
+
+
+def test_collar_pairs_each_put_with_calls_at_or_above_its_strike(sample_puts, sample_calls):
+    df = calculate_collar_metrics(sample_puts, sample_calls, cost_basis=160.0, current_price=170.0)
+
+    # 165 put -> both calls in call order, 180 put -> no valid call (put-only row)
+    assert df['put_label'].str[:21].tolist() == ['PG 2026 18-DEC 165.00'] * 2 + ['PG 2026 18-DEC 180.00']
+    assert df['call_label'].tolist() == ['PG 2026 20-NOV 175.00 CALL (33)', 'PG 2026 20-NOV 170.00 CALL (33)', None]
+
+    ncb = 160.0 + 4.0 - 1.2
+    assert df.loc[0, 'new_cost_basis'] == pytest.approx(ncb)
+    assert df.loc[0, 'locked_in_profit_pct'] == pytest.approx((165.0 - ncb) / ncb * 100)
+    assert df.loc[0, 'pct_assigned'] == pytest.approx((175.0 - ncb) / ncb * 100)
+    assert df.loc[0, 'pct_assigned_with_put'] == pytest.approx((175.0 - ncb) / ncb * 100)
+    assert df.loc[2, 'new_cost_basis'] == pytest.approx(170.5)
+    assert np.isnan(df.loc[2, 'pct_assigned'])
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_zero_cost_basis_and_dte_give_zero_without_warnings(sample_puts, sample_calls):
+    calls = sample_calls.assign(premium_option_price=[1.0, 2.0])
+    df = calculate_collar_metrics(sample_puts, calls, cost_basis=-3.0, current_price=170.0)
+
+    assert df.loc[0, 'new_cost_basis'] == pytest.approx(0.0)
+    assert df.loc[0, ['locked_in_profit_pct', 'pct_assigned', 'pct_assigned_with_put']].tolist() == [0.0, 0.0, 0.0]
+    assert df.loc[2, 'put_time_value_per_mo'] == 0.0
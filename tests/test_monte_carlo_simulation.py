@@ -0,0 +1,405 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.monte_carlo_simulation import (
+    PAYOFF_PERCENTILES,
+    UniversalOptionsMonteCarloSimulator,
+    _batch_payoff_stats_numpy,
+    _inverse_normal_cdf,
+    _payoff_moments,
+    _payoff_moments_numpy,
+    _strategy_payoffs_numpy,
+    _standard_normal_shocks_cached,
+    _summarize_payoffs,
+    _unpack_options,
+    analyze_many,
+)
+
+
+@pytest.fixture
+def put_credit_spread():
+    return [
+        {'strike': 150, 'premium': 3.47, 'is_call': False, 'is_long': False},
+        {'strike': 145, 'premium': 1.72, 'is_call': False, 'is_long': True},
+    ]
+
+
+def make_simulator(**kwargs):
+    params = dict(
+        current_price=170.94,
+        volatility=0.42,
+        dte=63,
+        risk_free_rate=0.03,
+        num_simulations=20000,
+        random_seed=42,
+        iv_correction='auto',
+    )
+    params.update(kwargs)
+    return UniversalOptionsMonteCarloSimulator(**params)
+
+
+def test_simulated_prices_are_antithetic_pairs():
+    simulator = make_simulator(num_simulations=1000)
+    prices = simulator.simulate_stock_prices()
+
+    assert prices.shape == (1000,)
+    # log returns of each pair are mirrored around the risk-neutral drift
+    log_returns = np.log(prices / simulator.current_price)
+    drift_term = (simulator.risk_free_rate - 0.5 * simulator.volatility ** 2) * simulator.time_to_expiration
+    np.testing.assert_allclose(log_returns[:500] + log_returns[500:], 2 * drift_term, atol=1e-6)
+
+
+def test_simulated_prices_without_antithetic_pairs_are_independent():
+    simulator = make_simulator(num_simulations=1000, use_antithetic=False)
+    prices = simulator.simulate_stock_prices()
+
+    assert prices.shape == (1000,)
+    log_returns = np.log(prices / simulator.current_price)
+    drift_term = (simulator.risk_free_rate - 0.5 * simulator.volatility ** 2) * simulator.time_to_expiration
+    assert not np.allclose(log_returns[:500] + log_returns[500:], 2 * drift_term, atol=1e-6)
+    assert prices is not make_simulator(num_simulations=1000).simulate_stock_prices()
+
+
+def test_simulated_prices_support_odd_simulation_counts():
+    simulator = make_simulator(num_simulations=1001)
+    assert simulator.simulate_stock_prices().shape == (1001,)
+
+
+def test_simulated_prices_are_reproducible_with_seed():
+    first = make_simulator().simulate_stock_prices()
+    second = make_simulator().simulate_stock_prices()
+    np.testing.assert_array_equal(first, second)
+
+
+def test_analyze_strategy_matches_expected_value(put_credit_spread):
+    simulator = make_simulator()
+    results = simulator.analyze_strategy(put_credit_spread)
+
+    assert results['expected_value'] == pytest.approx(simulator.calculate_expected_value(put_credit_spread))
+    assert results['num_legs'] == 2
+    assert results['initial_cashflow'] == pytest.approx((3.47 - 1.72) * 100 - 2 * simulator.transaction_cost_per_contract)
+    assert results['max_profit'] == pytest.approx(results['initial_cashflow'])
+    assert 0 <= results['prob_profit'] <= 100
+    assert len(results['breakeven_points']) == 1
+    assert results['breakeven_points'] == [pytest.approx(150 - 1.75 + 0.04)]
+
+
+def test_simulation_buffers_are_float32_with_float64_reductions(put_credit_spread):
+    simulator = make_simulator(current_price=np.float64(170.94))
+    prices = simulator.simulate_stock_prices()
+    assert prices.dtype == np.float32
+
+    results = simulator.analyze_strategy(put_credit_spread)
+    assert isinstance(results['expected_value_raw'], float)
+
+    # numpy float64 leg values must not upcast the payoff buffers
+    leg_payoffs = simulator.calculate_single_option_payoff(prices, np.float64(150.0), np.float64(3.47), False, False)
+    assert leg_payoffs.dtype == np.float32
+    assert make_simulator(sampler='pseudo').simulate_stock_prices().dtype == np.float32
+
+
+def test_seeded_simulation_is_shared_between_simulators():
+    first = make_simulator().simulate_stock_prices()
+    second = make_simulator().simulate_stock_prices()
+    assert first is second
+    assert not first.flags.writeable
+
+    other_underlying = make_simulator(current_price=100.0).simulate_stock_prices()
+    assert other_underlying is not first
+
+
+def test_seeded_shocks_are_shared_between_underlyings():
+    make_simulator(current_price=50.0, volatility=0.3).simulate_stock_prices()
+    hits = _standard_normal_shocks_cached.cache_info().hits
+
+    prices = make_simulator(current_price=80.0, volatility=0.5).simulate_stock_prices()
+    assert _standard_normal_shocks_cached.cache_info().hits == hits + 1
+    assert prices.shape == (20000,)
+
+
+def test_unseeded_simulation_is_not_cached():
+    simulator = make_simulator(random_seed=None)
+    assert simulator.simulate_stock_prices() is not simulator.simulate_stock_prices()
+
+
+@pytest.mark.parametrize("num_values", [1, 2, 7, 1000])
+def test_summarize_payoffs_matches_numpy_reductions(num_values):
+    payoffs = np.random.default_rng(0).normal(50, 200, num_values).astype(np.float32)
+    stats = _summarize_payoffs(payoffs)
+
+    assert stats['expected_value_raw'] == pytest.approx(np.mean(payoffs, dtype=np.float64))
+    assert stats['std_dev'] == pytest.approx(np.std(payoffs, dtype=np.float64), abs=1e-6)
+    assert stats['prob_profit'] == pytest.approx((payoffs > 0).mean() * 100)
+    assert stats['prob_loss'] == pytest.approx((payoffs < 0).mean() * 100)
+    assert stats['prob_breakeven'] == pytest.approx((np.abs(payoffs) < 1.0).mean() * 100)
+    assert stats['max_profit'] == payoffs.max()
+    assert stats['max_loss'] == payoffs.min()
+    np.testing.assert_allclose(stats['percentiles'], np.percentile(payoffs, PAYOFF_PERCENTILES), rtol=1e-6)
+
+
+def test_numpy_moments_fallback_matches_kernel():
+    payoffs = np.array([-3.0, 0.5, 0.0, 12.0, -0.2], dtype=np.float32)
+    np.testing.assert_allclose(_payoff_moments(payoffs), _payoff_moments_numpy(payoffs), rtol=1e-6)
+
+
+def test_sobol_sampler_converges_with_fewer_simulations(put_credit_spread):
+    reference = make_simulator(num_simulations=400000, random_seed=7, sampler='pseudo').calculate_expected_value(put_credit_spread)
+    sobol = make_simulator(num_simulations=4096, sampler='sobol').calculate_expected_value(put_credit_spread)
+    assert sobol == pytest.approx(reference, abs=1.0)
+
+    # Seeded Sobol shocks are reproducible and cached separately from pseudo-random ones
+    assert make_simulator(sampler='sobol').simulate_stock_prices() is make_simulator(sampler='sobol').simulate_stock_prices()
+    assert make_simulator(sampler='sobol').simulate_stock_prices() is not make_simulator(sampler='pseudo').simulate_stock_prices()
+
+
+def test_stratified_sampler_matches_analytic_expected_value(put_credit_spread):
+    simulator = make_simulator(num_simulations=10000, sampler='stratified')
+    shocks = np.log(simulator.simulate_stock_prices()[:5000] / simulator.current_price)
+
+    assert np.all(np.diff(shocks) > 0)  # one draw per stratum, in quantile order
+    assert simulator.calculate_expected_value(put_credit_spread) == pytest.approx(
+        simulator.calculate_expected_value(put_credit_spread, analytic=True), abs=0.1)
+
+
+def test_unknown_sampler_is_rejected():
+    with pytest.raises(ValueError):
+        make_simulator(sampler='halton')
+
+
+def test_analyze_strategy_arrays_matches_leg_loop(put_credit_spread):
+    simulator = make_simulator()
+    results = simulator.analyze_strategy_arrays(
+        strikes=np.array([150.0, 145.0]),
+        premiums=np.array([3.47, 1.72]),
+        is_call=np.array([False, False]),
+        is_long=np.array([False, True]),
+    )
+    assert results['expected_value'] == pytest.approx(simulator.analyze_strategy(put_credit_spread)['expected_value'])
+
+    prices = simulator.simulate_stock_prices()
+    for leg, option in zip(results['leg_analysis'], put_credit_spread):
+        leg_payoffs = simulator.calculate_single_option_payoff(prices, **option)
+        assert leg['avg_payoff'] == pytest.approx(np.mean(leg_payoffs, dtype=np.float64), rel=1e-5)
+        assert leg['strike'] == option['strike']
+        assert leg['position'] == ('Long' if option['is_long'] else 'Short')
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_analyze_strategies_batch_matches_single_analysis(put_credit_spread, use_kernel, monkeypatch):
+    if not use_kernel:
+        monkeypatch.setattr('src.monte_carlo_simulation._batch_payoff_stats', _batch_payoff_stats_numpy)
+    simulator = make_simulator()
+    call_credit_spread = [
+        {'strike': 190, 'premium': 2.10, 'is_call': True, 'is_long': False},
+        {'strike': 195, 'premium': 1.25, 'is_call': True, 'is_long': True},
+    ]
+    strategies = [put_credit_spread, call_credit_spread, put_credit_spread]
+
+    # Force several chunks along K in the NumPy fallback
+    monkeypatch.setattr('src.monte_carlo_simulation.BATCH_MAX_TENSOR_ELEMENTS', 2 * 2 * simulator.num_simulations)
+    batch = simulator.analyze_strategies_batch(
+        strikes=[[leg['strike'] for leg in legs] for legs in strategies],
+        premiums=[[leg['premium'] for leg in legs] for legs in strategies],
+        is_call=[[leg['is_call'] for leg in legs] for legs in strategies],
+        is_long=[[leg['is_long'] for leg in legs] for legs in strategies],
+    )
+
+    for k, legs in enumerate(strategies):
+        single = simulator.analyze_strategy(legs)
+        for key in ('expected_value', 'initial_cashflow', 'prob_profit', 'prob_loss', 'max_profit', 'max_loss', 'std_dev'):
+            assert batch[key][k] == pytest.approx(single[key], rel=1e-5)
+
+
+def test_analyze_many_matches_serial_analysis(put_credit_spread):
+    simulator_kwargs = dict(current_price=170.94, volatility=0.42, dte=63, num_simulations=5000, random_seed=42)
+    strategies = [put_credit_spread, put_credit_spread[:1]]
+
+    results = analyze_many(simulator_kwargs, strategies, workers=2)
+
+    simulator = UniversalOptionsMonteCarloSimulator(**simulator_kwargs)
+    assert [result['expected_value'] for result in results] == pytest.approx(
+        [simulator.analyze_strategy(strategy)['expected_value'] for strategy in strategies]
+    )
+
+
+def test_analyze_many_spawns_independent_seeds_without_seed(put_credit_spread):
+    simulator_kwargs = dict(current_price=170.94, volatility=0.42, dte=63, num_simulations=5000, random_seed=None)
+    first, second = analyze_many(simulator_kwargs, [put_credit_spread, put_credit_spread], workers=2)
+    assert first['expected_value'] != second['expected_value']
+
+
+def test_simulator_does_not_touch_global_random_state(put_credit_spread):
+    np.random.seed(123)
+    expected = np.random.random()
+
+    np.random.seed(123)
+    make_simulator(random_seed=7).analyze_strategy(put_credit_spread)
+    make_simulator(random_seed=None).analyze_strategy(put_credit_spread)
+    assert np.random.random() == expected
+
+
+@pytest.mark.parametrize("strikes, premiums, is_call, is_long, expected", [
+    # Long call: strike + premium + costs (tail beyond the highest strike)
+    ([100.0], [2.0], [True], [True], [102.02]),
+    # Long straddle: one breakeven on each side
+    ([100.0, 100.0], [2.0, 3.0], [True, False], [True, True], [94.96, 105.04]),
+    # Iron condor: 2.00 net credit minus 4 * $2 costs
+    ([90.0, 95.0, 105.0, 110.0], [0.5, 1.5, 1.5, 0.5], [False, False, True, True], [True, False, False, True],
+     [93.08, 106.92]),
+    # Long put that can never recover its premium above 0
+    ([1.0], [2.0], [False], [True], []),
+])
+def test_breakeven_points_are_exact(strikes, premiums, is_call, is_long, expected):
+    simulator = make_simulator()
+    assert simulator.calculate_breakeven_points(strikes, premiums, is_call, is_long) == pytest.approx(expected)
+
+
+def test_unpack_options_builds_contiguous_leg_arrays(put_credit_spread):
+    strikes, premiums, is_call, is_long = _unpack_options(put_credit_spread)
+
+    np.testing.assert_array_equal(strikes, [150.0, 145.0])
+    np.testing.assert_array_equal(premiums, [3.47, 1.72])
+    np.testing.assert_array_equal(is_call, [False, False])
+    np.testing.assert_array_equal(is_long, [False, True])
+    assert is_long.dtype == bool and strikes.flags.c_contiguous
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_strategy_payoffs_match_sum_of_single_legs(put_credit_spread, use_kernel, monkeypatch):
+    if not use_kernel:
+        monkeypatch.setattr('src.monte_carlo_simulation._strategy_payoffs', _strategy_payoffs_numpy)
+    simulator = make_simulator()
+    prices, total_payoffs, initial_cashflow = simulator._calculate_strategy_payoffs(put_credit_spread)
+
+    expected = sum(simulator.calculate_single_option_payoff(prices, **option) for option in put_credit_spread)
+    assert total_payoffs.dtype == np.float32
+    np.testing.assert_allclose(total_payoffs, expected, atol=1e-3)
+    assert initial_cashflow == pytest.approx(175.0 - 2 * simulator.transaction_cost_per_contract)
+
+
+@pytest.mark.parametrize("options", [
+    [{'strike': 150, 'premium': 3.47, 'is_call': False, 'is_long': False},
+     {'strike': 145, 'premium': 1.72, 'is_call': False, 'is_long': True}],
+    [{'strike': 175, 'premium': 9.10, 'is_call': True, 'is_long': True}],
+    [{'strike': 160, 'premium': 4.00, 'is_call': False, 'is_long': True},
+     {'strike': 185, 'premium': 4.50, 'is_call': True, 'is_long': False}],
+])
+def test_analytic_expected_value_matches_simulation(options):
+    simulator = make_simulator(num_simulations=2 ** 18, dividend_yield=0.01)
+    analytic = simulator.calculate_expected_value(options, analytic=True)
+
+    assert analytic == pytest.approx(simulator.calculate_expected_value(options), abs=0.05)
+    assert analytic == pytest.approx(simulator.calculate_analytic_expected_value(options))
+
+
+def test_analytic_expected_value_at_expiration():
+    simulator = make_simulator(dte=0)
+    options = [{'strike': 160, 'premium': 5.0, 'is_call': True, 'is_long': True}]
+    assert simulator.calculate_expected_value(options, analytic=True) == pytest.approx((170.94 - 160 - 5.0) * 100 - 2.0)
+
+
+def test_breakevens_from_simulations_match_exact_breakevens(put_credit_spread):
+    simulator = make_simulator()
+    prices, total_payoffs, _ = simulator._calculate_strategy_payoffs(put_credit_spread)
+
+    assert simulator.find_breakeven_from_simulations(prices, total_payoffs) == [pytest.approx(148.29, abs=0.05)]
+    assert simulator.find_breakeven_from_simulations(prices, np.full_like(total_payoffs, 10.0)) == []
+
+
+@pytest.mark.parametrize("dte, expected", [(0, 0.0), (7, 0.08), (30, 0.08), (90, 0.08 + 0.05 * np.log(3)), (1000, 0.25)])
+def test_iv_correction_factor(dte, expected):
+    assert make_simulator(dte=dte)._calculate_iv_correction_factor(dte) == pytest.approx(expected)
+
+
+def test_analyze_strategies_shares_one_simulation(put_credit_spread, monkeypatch):
+    simulator = make_simulator(random_seed=None)
+    call_credit_spread = [
+        {'strike': 190, 'premium': 2.10, 'is_call': True, 'is_long': False},
+        {'strike': 195, 'premium': 1.25, 'is_call': True, 'is_long': True},
+    ]
+
+    calls = []
+    simulate = simulator.simulate_stock_prices
+    monkeypatch.setattr(simulator, 'simulate_stock_prices', lambda: calls.append(1) or simulate())
+    results = simulator.analyze_strategies([put_credit_spread, call_credit_spread])
+
+    assert len(calls) == 1
+    assert [result['num_legs'] for result in results] == [2, 2]
+    assert results[0]['breakeven_points'] == [pytest.approx(148.29)]
+    assert results[1]['breakeven_points'] == [pytest.approx(190.81)]
+
+
+@pytest.mark.parametrize("stock_price, strike, is_call, expected", [
+    (110.0, 100.0, True, 10.0), (90.0, 100.0, True, 0.0), (90.0, 100.0, False, 10.0), (110.0, 100.0, False, 0.0),
+])
+def test_option_intrinsic_value(stock_price, strike, is_call, expected):
+    assert make_simulator().calculate_option_intrinsic_value(stock_price, strike, is_call) == expected
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+@pytest.mark.parametrize("is_long", [True, False])
+def test_single_option_payoff_matches_intrinsic_value(is_call, is_long):
+    simulator = make_simulator()
+    prices = simulator.simulate_stock_prices()[:50]
+    payoffs = simulator.calculate_single_option_payoff(prices, 170.0, 4.25, is_call, is_long)
+
+    sign = 1 if is_long else -1
+    expected = [sign * (simulator.calculate_option_intrinsic_value(price, 170.0, is_call) - 4.25) * 100 - 2.0
+                for price in prices.astype(np.float64)]
+    assert payoffs.dtype == np.float32
+    np.testing.assert_allclose(payoffs, expected, atol=1e-3)
+
+
+def test_piecewise_linear_payoffs_match_leg_matrix():
+    simulator = make_simulator()
+    prices = np.concatenate([simulator.simulate_stock_prices(), np.array([145.0, 150.0, 190.0, 0.0], dtype=np.float32)])
+    strikes = np.array([150.0, 145.0, 190.0, 195.0, 150.0])
+    premiums = np.array([3.47, 1.72, 2.10, 1.25, 0.80])
+    is_call = np.array([False, False, True, True, True])
+    is_long = np.array([False, True, False, True, True])
+
+    payoffs = _strategy_payoffs_numpy(prices, strikes, np.where(is_call, 1.0, -1.0), np.where(is_long, 100.0, -100.0),
+                                      float(simulator._initial_cashflow(premiums, is_long)))
+    expected = simulator._leg_payoff_matrix(prices, strikes, premiums, is_call, is_long).sum(axis=0)
+    np.testing.assert_allclose(payoffs, expected, atol=5e-3)
+
+
+def test_unpack_options_accepts_leg_objects(put_credit_spread):
+    legs = [SimpleNamespace(**option) for option in put_credit_spread]
+    for unpacked, expected in zip(_unpack_options(legs), _unpack_options(put_credit_spread)):
+        np.testing.assert_array_equal(unpacked, expected)
+
+    simulator = make_simulator()
+    assert simulator.calculate_expected_value(legs) == pytest.approx(simulator.calculate_expected_value(put_credit_spread))
+
+
+def test_inverse_normal_cdf_stays_finite_at_the_bounds():
+    shocks = _inverse_normal_cdf(np.array([0.0, 0.5, 1.0]))
+    assert np.all(np.isfinite(shocks))
+    assert shocks[1] == 0.0 and shocks[0] == pytest.approx(-shocks[2], rel=1e-2)
+
+
+def test_adaptive_expected_value_meets_tolerance(put_credit_spread):
+    simulator = make_simulator(num_simulations=200000)
+    analytic = simulator.calculate_analytic_expected_value(put_credit_spread)
+
+    assert simulator.calculate_expected_value_adaptive(put_credit_spread, tolerance=2.0) == pytest.approx(analytic, abs=4.0)
+
+
+@pytest.mark.parametrize("kwargs", [{'tolerance': 0}, {'tolerance': -0.5}, {'pilot_simulations': 1}])
+def test_adaptive_expected_value_rejects_invalid_parameters(put_credit_spread, kwargs):
+    simulator = make_simulator()
+    with pytest.raises(ValueError):
+        simulator.calculate_expected_value_adaptive(put_credit_spread, **kwargs)
+
+
+def test_adaptive_expected_value_stops_after_pilot_for_deterministic_payoff():
+    simulator = make_simulator()
+    # Deep OTM put credit spread: worthless at expiration in every plausible scenario
+    options = [{'strike': 20, 'premium': 0.05, 'is_call': False, 'is_long': False},
+               {'strike': 15, 'premium': 0.02, 'is_call': False, 'is_long': True}]
+
+    expected = (3.0 - 2 * simulator.transaction_cost_per_contract) * simulator._discount_factor
+    assert simulator.calculate_expected_value_adaptive(options) == pytest.approx(expected)
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from src.multifactor_swingtrading_strategy import calculate_multifactor_swingtrading_strategy
+
+
+VALUE_FACTORS_LOW = [
+    'price_to_book',
+    'price_to_earnings',
+    'price_to_sales',
+    'ebitda_to_enterprise_value',
+    'price_to_cashflow',
+]
+
+
+def make_universe(num_rows=200, seed=7):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({col: rng.integers(1, 40, num_rows).astype(float) for col in VALUE_FACTORS_LOW})
+    df['shareholder_yield'] = rng.integers(-5, 10, num_rows).astype(float)
+    df.loc[::17, 'price_to_earnings'] = np.nan
+    df['symbol'] = [f'S{i}' for i in range(num_rows)]
+    return df
+
+
+def test_percentiles_match_pandas_rank():
+    df = make_universe()
+    result = calculate_multifactor_swingtrading_strategy(df, top_percentile_value_score=100, top_n=len(df))
+    result = result.set_index('symbol').loc[df['symbol']]
+
+    for col in VALUE_FACTORS_LOW:
+        expected = (100 - df[col].rank(pct=True) * 100).round(2)
+        np.testing.assert_array_equal(result[f'{col}_percentile'].to_numpy(), expected.to_numpy())
+    expected = (df['shareholder_yield'].rank(pct=True) * 100).round(2)
+    np.testing.assert_array_equal(result['shareholder_yield_percentile'].to_numpy(), expected.to_numpy())
+
+
+def test_weak_value_factor_filter_keeps_only_rows_inside_bounds():
+    df = pd.DataFrame({
+        'symbol': ['KEEP', 'PB_HIGH', 'PE_LOW', 'CF_NEG', 'CRASH'],
+        'price_to_book': [1.0, 2.5, 1.0, 1.0, 1.0],
+        'price_to_earnings': [10, 10, 4, 10, 10],
+        'price_to_sales': [1.0, 1.0, 1.0, 1.0, 1.0],
+        'ebitda_to_enterprise_value': [0.1, 0.1, 0.1, 0.1, 0.1],
+        'price_to_cashflow': [5, 5, 5, -1, 5],
+        'shareholder_yield': [2, 2, 2, 2, 2],
+        '1_year_price_appreciation': [0.1, 0.1, 0.1, 0.1, -0.5],
+    })
+
+    result = calculate_multifactor_swingtrading_strategy(
+        df, top_percentile_value_score=100, drop_weak_value_factors=True
+    )
+
+    assert result['symbol'].tolist() == ['KEEP']
+
+
+def test_top_selection_matches_quantile_and_nlargest():
+    df = make_universe(num_rows=300, seed=11)
+    full = calculate_multifactor_swingtrading_strategy(df, top_percentile_value_score=100, top_n=len(df))
+    # Reference: original quantile filter + nlargest on the unordered scores
+    scores = full.set_index('symbol').loc[df['symbol'], 'value_score'].reset_index()
+    threshold = scores['value_score'].quantile(1 - 20 / 100)
+    expected = scores[scores['value_score'] >= threshold].nlargest(25, 'value_score')
+
+    result = calculate_multifactor_swingtrading_strategy(df, top_percentile_value_score=20, top_n=25)
+
+    assert result['symbol'].tolist() == expected['symbol'].tolist()
+    assert len(calculate_multifactor_swingtrading_strategy(df, top_n=0)) == 0
+
+
+def test_input_frame_is_not_modified():
+    df = make_universe()
+    original = df.copy()
+
+    calculate_multifactor_swingtrading_strategy(df, drop_missing_values=True)
+    calculate_multifactor_swingtrading_strategy(df)
+
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_result_starts_with_symbol_and_value_score():
+    result = calculate_multifactor_swingtrading_strategy(make_universe())
+
+    assert list(result.columns[:2]) == ['symbol', 'value_score']
+    assert result.columns[-1] == 'shareholder_yield_percentile'
+    assert result['value_score'].is_monotonic_decreasing
@@ -0,0 +1,115 @@
+import urllib.parse
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+import src.page_display_dataframe as page_display
+from src.page_display_dataframe import (
+    _CLAUDE_PROMPT_FOOTER,
+    _CLAUDE_PROMPT_HEADER,
+    _add_claude_analysis_link,
+    _add_tradingview_link,
+    _add_tradingview_superchart_link,
+    _color_negative_red,
+    _create_claude_prompt_page_spreads,
+    _get_sector_prompt,
+)
+
+
+def make_spreads():
+    return pd.DataFrame({
+        'symbol': ['AAPL', 'XOM'],
+        'company_sector': ['Technology', 'Unknown'],
+        'Company': ['Apple', 'Exxon'],
+        'option_type': ['put', 'call'],
+        'sell_strike': [170.0, 110.0],
+        'sell_last_option_price': [2.15, 1.2],
+        'sell_delta': [-0.3, 0.25],
+        'buy_strike': [165.0, 115.0],
+        'buy_last_option_price': [1.05, 0.4],
+        'expiration_date': ['2026-12-18', '2026-12-18'],
+    })
+
+
+def test_tradingview_links_are_built_per_symbol():
+    df = _add_tradingview_superchart_link(_add_tradingview_link(make_spreads()))
+
+    assert df['TradingView'].tolist() == [
+        'https://www.tradingview.com/symbols/AAPL/',
+        'https://www.tradingview.com/symbols/XOM/',
+    ]
+    assert df['Chart'].tolist() == [
+        'https://www.tradingview.com/chart/?symbol=AAPL',
+        'https://www.tradingview.com/chart/?symbol=XOM',
+    ]
+
+
+def test_claude_links_match_row_prompt_builder():
+    df = make_spreads()
+    expected = [_create_claude_prompt_page_spreads(row) for _, row in df.iterrows()]
+
+    result = _add_claude_analysis_link(df, page='spreads')
+
+    assert result['Claude'].tolist() == expected
+    assert result['Claude'].str.startswith('https://claude.ai/new?q=').all()
+
+
+def test_claude_links_handle_unhashable_cells():
+    df = make_spreads()
+    df['Company'] = [['Apple'], ['Exxon']]
+    expected = [_create_claude_prompt_page_spreads(row) for _, row in df.iterrows()]
+
+    assert _add_claude_analysis_link(df, page='spreads')['Claude'].tolist() == expected
+
+
+def test_claude_links_ignore_columns_not_used_in_prompt():
+    df = make_spreads()
+    wide = df.assign(sell_iv=[0.3, 0.2], bpr=[500, 500])
+
+    assert (_add_claude_analysis_link(wide, page='spreads')['Claude'].tolist()
+            == _add_claude_analysis_link(df, page='spreads')['Claude'].tolist())
+
+
+def test_negative_numbers_are_colored_red():
+    df = pd.DataFrame({'pnl': [-1.5, 2.0, np.nan], 'qty': pd.array([-3, None, 4], dtype='Int64')})
+
+    css = _color_negative_red(df)
+
+    assert css['pnl'].tolist() == ['color: #ff4444', '', '']
+    assert css['qty'].tolist() == ['color: #ff4444', '', '']
+
+
+def test_spreads_prompt_url_decodes_to_full_prompt():
+    sector_row, fallback_row = make_spreads().to_dict('records')
+    legs = """
+Verkaufe einen call Strike 110.0 für eine Prämie von 1.2 bei einem Delta
+von 0.25. Kaufe einen call mit Strike 115.0
+für eine Prämie von 0.4. Expirationdate ist jeweils 2026-12-18
+"""
+    header = _CLAUDE_PROMPT_HEADER.format(symbol='XOM', company_info=' (Exxon)')
+    expected_fallback = (header + legs + _CLAUDE_PROMPT_FOOTER).strip()
+
+    fallback_url = _create_claude_prompt_page_spreads(fallback_row)
+    sector_url = _create_claude_prompt_page_spreads(sector_row)
+
+    assert urllib.parse.unquote(fallback_url.removeprefix('https://claude.ai/new?q=')) == expected_fallback
+    sector_prompt = urllib.parse.unquote(sector_url.removeprefix('https://claude.ai/new?q='))
+    assert sector_prompt.startswith(_get_sector_prompt('Technology', 'AAPL').strip())
+    assert 'Options-Strategie für AAPL' in sector_prompt
+
+
+def test_empty_frame_is_displayed_without_styling(monkeypatch):
+    displayed = {}
+    fake_st = SimpleNamespace(
+        column_config=SimpleNamespace(LinkColumn=lambda *args, **kwargs: None,
+                                      NumberColumn=lambda *args, **kwargs: None),
+        dataframe=lambda data, **kwargs: displayed.update(data=data, **kwargs),
+    )
+    monkeypatch.setattr(page_display, 'st', fake_st)
+
+    page_display.page_display_dataframe(pd.DataFrame({'symbol': pd.Series(dtype=str), 'pnl': pd.Series(dtype=float)}))
+
+    assert isinstance(displayed['data'], pd.DataFrame)
+    assert list(displayed['data'].columns) == ['symbol', 'pnl', 'TradingView', 'Chart', 'Claude']
+    assert 'pnl' in displayed['column_config'] and 'symbol' not in displayed['column_config']
@@ -0,0 +1,45 @@
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import pandas as pd
+from cachelib import FileSystemCache
+
+import src.price_and_technical_analysis_data_scrapper as scrapper
+
+
+def _analysis(rsi):
+    return SimpleNamespace(
+        indicators={"RSI": rsi},
+        summary={"RECOMMENDATION": "BUY", "BUY": 10, "NEUTRAL": 5, "SELL": 2},
+    )
+
+
+def test_fresh_cached_analysis_skips_the_request(monkeypatch, tmp_path):
+    requested = []
+    inserted = []
+
+    def fake_get_multiple_analysis(screener, interval, symbols):
+        requested.append(list(symbols))
+        return {"NASDAQ:AAPL": _analysis(55.0), "NYSE:XYZ": None}
+
+    monkeypatch.setattr(scrapper, "get_multiple_analysis", fake_get_multiple_analysis)
+    monkeypatch.setattr(scrapper, "_get_analysis_cache", lambda: FileSystemCache(str(tmp_path), threshold=0))
+    monkeypatch.setattr(scrapper, "get_postgres_engine", lambda: SimpleNamespace(begin=nullcontext))
+    monkeypatch.setattr(scrapper, "truncate_table", lambda connection, table: None)
+    monkeypatch.setattr(scrapper, "insert_into_table", lambda connection, dataframe, **kwargs: inserted.append(dataframe))
+
+    stocks = pd.DataFrame({"exchange": ["NASDAQ", "NYSE"], "symbol": ["AAPL", "XYZ"]})
+    scrapper.scrape_and_save_price_and_technical_indicators(stocks)
+    scrapper.scrape_and_save_price_and_technical_indicators(stocks)
+
+    # second run only asks again for the symbol that had no analysis
+    assert requested == [["NASDAQ:AAPL", "NYSE:XYZ"], ["NYSE:XYZ"]]
+    for df in inserted:
+        assert df.to_dict("records") == [{
+            "RSI": 55.0,
+            "symbol": "AAPL",
+            "recommendation": "BUY",
+            "recommendation_buy_amount": 10,
+            "recommendation_neutral_amount": 5,
+            "recommendation_sell_amount": 2,
+        }]